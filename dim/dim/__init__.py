@@ -39,6 +39,7 @@ def create_app(db_mode=None, testing=False):
     app.config.from_pyfile('defaults.py')
     app.config.from_pyfile('/etc/dim/dim.cfg', silent=True)
     app.config.from_pyfile('../etc/dim.cfg', silent=True)
+    app.config.from_envvar('DIM_CONFIG', silent=True)
     os.environ['REQUESTS_CA_BUNDLE'] = app.config['REQUESTS_CA_BUNDLE']
     app.testing = testing
     configure_logging(app)
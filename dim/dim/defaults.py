@@ -4,6 +4,8 @@ DB_PASSWORD = 'netdot_pass'
 DB_HOST     = 'localhost'
 SQLALCHEMY_DATABASE_URI = 'mysql://%s:%s@%s/netdot' % (DB_USERNAME, DB_PASSWORD, DB_HOST)
 DB_LOCK_TIMEOUT = 120
+# MySQL named lock serializing the write transactions (named locks are server-wide)
+DB_LOCK_NAME = 'netdot_transaction'
 
 
 ### Authentication
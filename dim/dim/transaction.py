@@ -93,7 +93,7 @@ def _transaction(f):
     def wrapper(*args, **kwargs):
         dryrun = kwargs.pop('dryrun', False)
         if not dryrun:
-            get_lock_for_transaction('netdot_transaction', current_app.config['DB_LOCK_TIMEOUT'])
+            get_lock_for_transaction(current_app.config['DB_LOCK_NAME'], current_app.config['DB_LOCK_TIMEOUT'])
         try:
             result = f(*args, **kwargs)
             if dryrun:
@@ -115,7 +115,7 @@ def _transaction_delayed_lock(f):
         def rollback_and_get_lock():
             if not dryrun:
                 db.session.rollback()
-                get_lock_for_transaction('netdot_transaction', current_app.config['DB_LOCK_TIMEOUT'])
+                get_lock_for_transaction(current_app.config['DB_LOCK_NAME'], current_app.config['DB_LOCK_TIMEOUT'])
         try:
             g.rollback_and_get_lock = rollback_and_get_lock
             result = f(*args, **kwargs)
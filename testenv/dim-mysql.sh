@@ -11,7 +11,7 @@ mysqladmin --socket=$MYSQL_DIR/mysql.sock --wait=1 -u root password ''
 
 # create databases
 MYSQL="mysql -uroot --socket=$MYSQL_DIR/mysql.sock"
-echo "create database dim; grant all privileges on dim.* to dim@localhost identified by 'dim';" | $MYSQL
+echo "create database dim; grant all privileges on \`dim%\`.* to dim@localhost identified by 'dim';" | $MYSQL
 echo "create database pdns1; grant all privileges on pdns1.* to pdns@localhost identified by 'pdns';" | $MYSQL
 echo "create database pdns2; grant all privileges on pdns2.* to pdns@localhost identified by 'pdns';" | $MYSQL
 $MYSQL pdns1 < /var/local/dim/pdns.sql